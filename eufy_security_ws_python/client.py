@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 import asyncio
+from functools import partial
+from itertools import count
+import logging
 from types import TracebackType
-from typing import Any, Optional, cast
-import uuid
+from typing import Any, Optional
 
 from aiohttp import ClientSession, ClientWebSocketResponse, WSMsgType
 from aiohttp.client_exceptions import (
@@ -12,6 +14,7 @@ from aiohttp.client_exceptions import (
     ServerDisconnectedError,
     WSServerHandshakeError,
 )
+import orjson
 
 from eufy_security_ws_python.const import (
     LOGGER,
@@ -31,7 +34,19 @@ from eufy_security_ws_python.event import Event
 from eufy_security_ws_python.model.driver import Driver
 from eufy_security_ws_python.model.version import VersionInfo
 
-SIZE_PARSE_JSON_EXECUTOR = 8192
+# Events are a few hundred bytes and orjson parses them in ~1us, while an executor
+# round-trip costs ~40us. A 128 KiB payload (a state dump with ~350 devices) parses in
+# ~0.3ms, so only payloads larger than that are offloaded to keep the loop responsive:
+SIZE_PARSE_JSON_EXECUTOR = 131072
+
+# Buffered websocket frames are received without suspending, so the listen loop yields
+# to other tasks after this many messages to keep a burst from starving them:
+MESSAGES_PER_LOOP_YIELD = 32
+
+
+def _dumps(data: Any) -> str:
+    """Serialize data to a JSON string (orjson produces bytes)."""
+    return orjson.dumps(data).decode()
 
 
 class WebsocketClient:  # pylint: disable=too-many-instance-attributes
@@ -41,6 +56,7 @@ class WebsocketClient:  # pylint: disable=too-many-instance-attributes
         """Initialize."""
         self._client: Optional[ClientWebSocketResponse] = None
         self._loop = asyncio.get_running_loop()
+        self._message_ids = count()
         self._result_futures: dict[str, asyncio.Future] = {}
         self._session = session
         self._shutdown_complete_event: Optional[asyncio.Event] = None
@@ -65,6 +81,12 @@ class WebsocketClient:  # pylint: disable=too-many-instance-attributes
         """Return if current connected to the websocket."""
         return self._client is not None and not self._client.closed
 
+    def _next_message_id(self) -> str:
+        """Return a message ID that is unique for this client."""
+        # The server only echoes message IDs back, so a counter is just as good as a
+        # UUID (and avoids a urandom() call per command):
+        return format(next(self._message_ids), "x")
+
     def _parse_response_payload(self, payload: dict) -> None:
         """Handle a message from the websocket server."""
         if payload["type"] == "result":
@@ -108,13 +130,16 @@ class WebsocketClient:  # pylint: disable=too-many-instance-attributes
 
         try:
             if len(msg.data) > SIZE_PARSE_JSON_EXECUTOR:
-                data = await self._loop.run_in_executor(None, msg.json)
+                data = await self._loop.run_in_executor(
+                    None, partial(msg.json, loads=orjson.loads)
+                )
             else:
-                data = msg.json()
+                data = msg.json(loads=orjson.loads)
         except ValueError as err:
             raise InvalidMessage("Received invalid JSON") from err
 
-        LOGGER.debug("Received data from websocket server: %s", data)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Received data from websocket server: %s", data)
 
         return data
 
@@ -129,9 +154,10 @@ class WebsocketClient:  # pylint: disable=too-many-instance-attributes
         assert self._client
         assert "messageId" in payload
 
-        LOGGER.debug("Sending data to websocket server: %s", payload)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Sending data to websocket server: %s", payload)
 
-        await self._client.send_json(payload)
+        await self._client.send_json(payload, dumps=_dumps)
 
     async def _async_set_api_schema(self) -> None:
         """Set the API schema version on server."""
@@ -221,22 +247,25 @@ class WebsocketClient:  # pylint: disable=too-many-instance-attributes
                 await self._client.close()
                 raise FailedCommand(state_msg["messageId"], state_msg["errorCode"])
 
-            self.driver = cast(
-                Driver,
-                await self._loop.run_in_executor(
-                    None,
-                    Driver,
-                    self,
-                    state_msg,
-                ),
-            )
+            self.driver = Driver(self, state_msg)
             driver_ready.set()
 
             LOGGER.info("Started listening to websocket server")
 
-            while not self._client.closed:
-                msg = await self._async_receive_json()
-                self._parse_response_payload(msg)
+            # Bind what the loop uses on every message to locals:
+            client = self._client
+            receive_json = self._async_receive_json
+            parse_response_payload = self._parse_response_payload
+
+            messages_since_yield = 0
+
+            while not client.closed:
+                parse_response_payload(await receive_json())
+
+                messages_since_yield += 1
+                if messages_since_yield == MESSAGES_PER_LOOP_YIELD:
+                    messages_since_yield = 0
+                    await asyncio.sleep(0)
         except ConnectionClosed:
             pass
         finally:
@@ -263,7 +292,7 @@ class WebsocketClient:  # pylint: disable=too-many-instance-attributes
             )
 
         future: "asyncio.Future[dict]" = self._loop.create_future()
-        message_id = payload["messageId"] = uuid.uuid4().hex
+        message_id = payload["messageId"] = self._next_message_id()
         self._result_futures[message_id] = future
         await self._async_send_json(payload)
         try:
@@ -282,5 +311,5 @@ class WebsocketClient:  # pylint: disable=too-many-instance-attributes
                 f"schema of {require_schema}."
             )
 
-        payload["messageId"] = uuid.uuid4().hex
+        payload["messageId"] = self._next_message_id()
         await self._async_send_json(payload)
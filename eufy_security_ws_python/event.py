@@ -2,10 +2,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Callable
+from itertools import count
+from typing import Any, Callable, ClassVar
 
 from eufy_security_ws_python.const import LOGGER
 
+# Hands out a unique handle for every registered listener:
+_LISTENER_HANDLES = count()
+
 
 @dataclass
 class Event:
@@ -18,21 +22,45 @@ class Event:
 class EventBase:
     """Define a base class for event handling."""
 
+    __slots__ = ("__weakref__", "_listener_snapshots", "_listeners")
+
+    # Caches the handler method name for each event type seen so far (e.g.,
+    # "property changed" -> "handle_property_changed"); one cache per subclass. Names
+    # (rather than functions) are cached so that handlers are still looked up on the
+    # instance, which keeps patched and overridden handlers working:
+    _HANDLERS: ClassVar[dict[str, str]] = {}
+
     def __init__(self) -> None:
         """Initialize event base."""
-        self._listeners: dict[str, list[Callable]] = {}
+        self._listeners: dict[str, dict[int, Callable]] = {}
+        # Tuples of each event's callbacks for emit(); rebuilt after any (un)subscribe:
+        self._listener_snapshots: dict[str, tuple[Callable, ...]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Give each subclass its own event handler cache."""
+        super().__init_subclass__(**kwargs)
+        cls._HANDLERS = {}
 
     def on(  # pylint: disable=invalid-name
         self, event_name: str, callback: Callable
     ) -> Callable:
         """Register an event callback."""
-        listeners = self._listeners.setdefault(event_name, [])
-        listeners.append(callback)
+        handle = next(_LISTENER_HANDLES)
+        self._listeners.setdefault(event_name, {})[handle] = callback
+        self._listener_snapshots.pop(event_name, None)
 
         def unsubscribe() -> None:
             """Unsubscribe listeners."""
-            if callback in listeners:
-                listeners.remove(callback)
+            listeners = self._listeners.get(event_name)
+            if listeners is None or listeners.pop(handle, None) is None:
+                return
+
+            self._listener_snapshots.pop(event_name, None)
+
+            # Drop the event name once nothing listens to it, so that membership in
+            # self._listeners tells whether an event has any subscribers:
+            if not listeners:
+                del self._listeners[event_name]
 
         return unsubscribe
 
@@ -49,12 +77,29 @@ class EventBase:
 
     def emit(self, event_name: str, data: dict) -> None:
         """Run all callbacks for an event."""
-        for listener in self._listeners.get(event_name, []):
+        # Iterate over a snapshot so that callbacks can (un)subscribe while running:
+        listeners = self._listener_snapshots.get(event_name)
+
+        if listeners is None:
+            callbacks = self._listeners.get(event_name)
+            if not callbacks:
+                return
+            listeners = self._listener_snapshots[event_name] = tuple(
+                callbacks.values()
+            )
+
+        for listener in listeners:
             listener(data)
 
     def _handle_event_protocol(self, event: Event) -> None:
         """Process an event based on event protocol."""
-        handler = getattr(self, f"handle_{event.type.replace(' ', '_')}", None)
+        try:
+            handler_name = self._HANDLERS[event.type]
+        except KeyError:
+            handler_name = f"handle_{event.type.replace(' ', '_')}"
+            self._HANDLERS[event.type] = handler_name
+
+        handler = getattr(self, handler_name, None)
 
         if handler is None:
             LOGGER.debug("Received unknown event: %s", event)
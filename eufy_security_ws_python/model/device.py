@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 class Device(EventBase):
     """Define a base device."""
 
+    __slots__ = ("_client", "_hash", "_serial_number", "_state")
+
     def __init__(self, client: "WebsocketClient", state: dict[str, Any]) -> None:
         """Initialize."""
         super().__init__()
@@ -19,19 +21,24 @@ class Device(EventBase):
         self._client = client
         self._state = state
 
+        # The serial number identifies the device (it's what the driver routes events
+        # by), so it can't change and is safe to read once:
+        self._serial_number: str = state["serialNumber"]
+        self._hash = hash(self._serial_number)
+
     def __repr__(self) -> str:
         """Return the representation."""
         return f"<{type(self).__name__} name={self.name} serial={self.serial_number}>"
 
     def __hash__(self) -> int:
         """Return the hash."""
-        return hash(self.serial_number)
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
         """Return whether this instance equals another."""
         if not isinstance(other, Device):
             return False
-        return self.serial_number == other.serial_number
+        return self._serial_number == other._serial_number
 
     @property
     def enabled(self) -> bool:
@@ -56,7 +63,7 @@ class Device(EventBase):
     @property
     def serial_number(self) -> str:
         """Return the serial number."""
-        return self._state["serialNumber"]
+        return self._serial_number
 
     @property
     def software_version(self) -> str:
@@ -78,13 +85,14 @@ class Device(EventBase):
         return await self._client.async_send_command(
             {
                 "command": "device.get_properties_metadata",
-                "serialNumber": self.serial_number,
+                "serialNumber": self._serial_number,
             }
         )
 
     def handle_property_changed(self, event: Event) -> None:
         """Handle a "property changed" event."""
-        self._state[event.data["name"]] = event.data["value"]
+        data = event.data
+        self._state[data["name"]] = data["value"]
 
     def receive_event(self, event: Event) -> None:
         """React to an event."""
@@ -1,7 +1,7 @@
 """Define the eufy-security-ws driver."""
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, Union
 
 from eufy_security_ws_python.event import Event, EventBase
 from eufy_security_ws_python.model.device import Device
@@ -19,39 +19,50 @@ class Driver(EventBase):
         super().__init__()
 
         self._state = state
-        self.stations: dict[str, Device] = {
+
+        state_root = state["result"]["state"]
+        self._driver_state: dict = state_root["driver"]
+        self.stations: dict[str, Station] = {
             station_state["serialNumber"]: Station(client, station_state)
-            for station_state in state["result"]["state"]["stations"]
+            for station_state in state_root["stations"]
         }
-        self.devices: dict[str, Station] = {
+        self.devices: dict[str, Device] = {
             device_state["serialNumber"]: Device(client, device_state)
-            for device_state in state["result"]["state"]["devices"]
+            for device_state in state_root["devices"]
+        }
+
+        # Maps an event's "source" to a getter for the objects that handle such events
+        # (bound ahead of time to skip an attribute load per event):
+        self._source_dispatch: dict[str, Callable[[str], Union[Station, Device]]] = {
+            "device": self.devices.__getitem__,
+            "station": self.stations.__getitem__,
         }
 
     @property
     def connected(self) -> bool:
         """Return whether the driver is connected."""
-        return self._state["result"]["state"]["driver"]["connected"]
+        return self._driver_state["connected"]
 
     @property
     def push_connected(self) -> bool:
         """Return whether the driver is connected to push events."""
-        return self._state["result"]["state"]["driver"]["pushConnected"]
+        return self._driver_state["pushConnected"]
 
     @property
     def version(self) -> bool:
         """Return the version."""
-        return self._state["result"]["state"]["driver"]["version"]
+        return self._driver_state["version"]
 
     def receive_event(self, event: Event) -> None:
         """React to an event."""
-        if event.data["source"] == "station":
-            station = self.stations[event.data["serialNumber"]]
-            station.receive_event(event)
-        elif event.data["source"] == "device":
-            device = self.devices[event.data["serialNumber"]]
-            device.receive_event(event)
-        else:
+        data = event.data
+        get_target = self._source_dispatch.get(data.get("source"))
+
+        if get_target is None:
             self._handle_event_protocol(event)
+        else:
+            get_target(data["serialNumber"]).receive_event(event)
 
-        self.emit(event.type, event.data)
+        # Most event types have no subscribers, so skip emit() for them entirely:
+        if event.type in self._listeners:
+            self.emit(event.type, data)
@@ -2,15 +2,32 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class VersionInfo:
     """Define the server's version info."""
 
+    # Declared by hand since dataclass(slots=True) requires Python 3.10:
+    __slots__ = (
+        "driver_version",
+        "server_version",
+        "min_schema_version",
+        "max_schema_version",
+    )
+
     driver_version: str
     server_version: str
     min_schema_version: int
     max_schema_version: int
 
+    def __getstate__(self) -> tuple:
+        """Return the state for copying/pickling (slots have no __dict__)."""
+        return tuple(getattr(self, slot) for slot in self.__slots__)
+
+    def __setstate__(self, state: tuple) -> None:
+        """Restore the state (bypassing the frozen __setattr__)."""
+        for slot, value in zip(self.__slots__, state):
+            object.__setattr__(self, slot, value)
+
     @classmethod
     def from_message(cls, msg: dict) -> "VersionInfo":
         """Create an instance from a version message."""
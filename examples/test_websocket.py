@@ -27,4 +27,11 @@ async def main() -> None:
         await client.async_listen(driver_ready)
 
 
+try:
+    import uvloop
+except ImportError:
+    pass
+else:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 asyncio.run(main())
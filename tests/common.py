@@ -1,9 +1,11 @@
 """Define common test utilities."""
+from functools import lru_cache
 import os
 
 
+@lru_cache(maxsize=None)
 def load_fixture(filename):
-    """Load a fixture."""
+    """Load a fixture as bytes (which orjson decodes without a str detour)."""
     path = os.path.join(os.path.dirname(__file__), "fixtures", filename)
-    with open(path, encoding="utf-8") as fptr:
+    with open(path, "rb") as fptr:
         return fptr.read()
@@ -1,12 +1,12 @@
 """Define dynamic test fixtures."""
 import asyncio
 from collections import deque
-import json
 from typing import List, Tuple
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, Mock
 
 from aiohttp import ClientSession, ClientWebSocketResponse
 from aiohttp.http_websocket import WSMessage, WSMsgType
+import orjson
 import pytest
 
 from eufy_security_ws_python.client import WebsocketClient
@@ -23,7 +23,7 @@ def create_ws_message(result):
     """Return a mock WSMessage."""
     message = Mock(spec_set=WSMessage)
     message.type = WSMsgType.TEXT
-    message.data = json.dumps(result)
+    message.data = orjson.dumps(result).decode()
     message.json.return_value = result
     return message
 
@@ -51,7 +51,7 @@ def client_session_fixture(ws_client):
 @pytest.fixture(name="controller_state", scope="session")
 def controller_state_fixture():
     """Load the controller state fixture data."""
-    return json.loads(load_fixture("controller_state.json"))
+    return orjson.loads(load_fixture("controller_state.json"))
 
 
 @pytest.fixture(name="driver")
@@ -73,7 +73,7 @@ def messages_fixture():
 
 
 @pytest.fixture(name="mock_command")
-def mock_command_fixture(ws_client, client, uuid4):
+def mock_command_fixture(ws_client, client):
     """Mock a command and response."""
     mock_responses: List[Tuple[dict, dict, bool]] = []
     ack_commands: List[dict] = []
@@ -88,14 +88,14 @@ def mock_command_fixture(ws_client, client, uuid4):
         mock_responses.append((match_command, response, success))
         return ack_commands
 
-    async def set_response(message):
+    async def set_response(message, **kwargs):
         """Check the message and set the mocked response if a command matches."""
         for match_command, response, success in mock_responses:
             if all(message[key] == value for key, value in match_command.items()):
                 ack_commands.append(message)
                 received_message = {
                     "type": "result",
-                    "messageId": uuid4,
+                    "messageId": message["messageId"],
                     "success": success,
                 }
                 if success:
@@ -112,20 +112,11 @@ def mock_command_fixture(ws_client, client, uuid4):
     return apply_mock_command
 
 
-@pytest.fixture(name="uuid4")
-def mock_uuid4_fixture():
-    """Return a mocked websocket UUID-based message ID."""
-    uuid4_hex = "1234"
-    with patch("uuid.uuid4") as uuid4:
-        uuid4.return_value.hex = uuid4_hex
-        yield uuid4_hex
-
-
 @pytest.fixture(name="result")
-def result_fixture(controller_state, uuid4):
+def result_fixture(controller_state):
     """Return a server result message."""
     return {
-        "messageId": uuid4,
+        "messageId": "start_listening",
         "result": {"state": controller_state},
         "success": True,
         "type": "result",
@@ -186,7 +177,7 @@ async def ws_client_fixture(
 
     ws_client.receive.side_effect = receive
 
-    async def close_client(msg):
+    async def close_client(msg, **kwargs):
         """Close the client."""
         if msg["command"] in ("set_api_schema", "start_listening"):
             return
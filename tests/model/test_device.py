@@ -0,0 +1,56 @@
+"""Define tests for devices."""
+from copy import deepcopy
+from unittest.mock import Mock
+import weakref
+
+import pytest
+
+from eufy_security_ws_python.event import Event
+from eufy_security_ws_python.model.device import Device
+
+
+@pytest.fixture(name="device")
+def device_fixture(controller_state):
+    """Return a device instance."""
+    return Device(Mock(), deepcopy(controller_state["devices"][0]))
+
+
+def test_properties(device):
+    """Test device properties."""
+    assert device.serial_number == "AABBCCDDEEFF1234"
+    assert device.name == "Driveway"
+    assert device.model == "T8111"
+    assert device.station_serial_number == "ABCDEF1234567890"
+    assert device.enabled is True
+
+
+def test_property_changed(device):
+    """Test that a "property changed" event updates the device."""
+    device.receive_event(
+        Event(
+            type="property changed",
+            data={
+                "source": "device",
+                "event": "property changed",
+                "serialNumber": "AABBCCDDEEFF1234",
+                "name": "enabled",
+                "value": False,
+            },
+        )
+    )
+    assert device.enabled is False
+    assert device.serial_number == "AABBCCDDEEFF1234"
+
+
+def test_slots(device):
+    """Test that devices use slots but remain weak-referenceable."""
+    assert not hasattr(device, "__dict__")
+    assert weakref.ref(device)() is device
+
+
+def test_hash_and_eq(controller_state, device):
+    """Test that devices are compared by serial number."""
+    other = Device(Mock(), deepcopy(controller_state["devices"][0]))
+    assert device == other
+    assert hash(device) == hash(other)
+    assert {device: 1}[other] == 1
@@ -0,0 +1,64 @@
+"""Define tests for the driver."""
+from copy import deepcopy
+from unittest.mock import Mock
+
+import pytest
+
+from eufy_security_ws_python.event import Event
+from eufy_security_ws_python.model.driver import Driver
+
+# pylint: disable=protected-access
+
+
+@pytest.fixture(name="isolated_driver")
+def isolated_driver_fixture(controller_state):
+    """Return a driver built from its own copy of the controller state."""
+    return Driver(Mock(), {"result": {"state": deepcopy(controller_state)}})
+
+
+def test_properties(isolated_driver):
+    """Test driver properties."""
+    assert isolated_driver.connected is True
+    assert isolated_driver.push_connected is True
+    assert isolated_driver.version == "0.8.2"
+    assert list(isolated_driver.stations) == ["ABCDEF1234567890"]
+    assert list(isolated_driver.devices) == ["AABBCCDDEEFF1234"]
+
+
+@pytest.mark.parametrize(
+    "source, serial_number, name, value",
+    [
+        ("station", "ABCDEF1234567890", "currentMode", 63),
+        ("device", "AABBCCDDEEFF1234", "enabled", False),
+    ],
+)
+def test_receive_event(isolated_driver, name, serial_number, source, value):
+    """Test that events are routed to their source and emitted."""
+    data = {
+        "source": source,
+        "event": "property changed",
+        "serialNumber": serial_number,
+        "name": name,
+        "value": value,
+    }
+    calls = []
+    isolated_driver.on("property changed", calls.append)
+
+    isolated_driver.receive_event(Event(type="property changed", data=data))
+
+    if source == "station":
+        target = isolated_driver.stations
+    else:
+        target = isolated_driver.devices
+    assert target[serial_number]._state[name] == value
+    assert calls == [data]
+
+
+def test_receive_driver_event(isolated_driver):
+    """Test that events without a station/device source are emitted."""
+    calls = []
+    isolated_driver.on("connected", calls.append)
+
+    isolated_driver.receive_event(Event(type="connected", data={"source": "driver"}))
+
+    assert calls == [{"source": "driver"}]
@@ -0,0 +1,66 @@
+"""Define tests for stations."""
+from copy import deepcopy
+from unittest.mock import Mock, patch
+import weakref
+
+import pytest
+
+from eufy_security_ws_python.event import Event
+from eufy_security_ws_python.model.station import Station
+
+
+@pytest.fixture(name="station")
+def station_fixture(controller_state):
+    """Return a station instance."""
+    return Station(Mock(), deepcopy(controller_state["stations"][0]))
+
+
+def test_properties(station):
+    """Test station properties."""
+    assert station.serial_number == "ABCDEF1234567890"
+    assert station.name == "Home"
+    assert station.model == "T8001"
+    assert station.mac_address == "AB:CD:EF:12:34:56"
+    assert station.alarm_mode == 1
+    assert station.guard_mode == 2
+    assert station.connected is True
+
+
+def test_property_changed(station):
+    """Test that a "property changed" event updates the station."""
+    station.receive_event(
+        Event(
+            type="property changed",
+            data={
+                "source": "station",
+                "event": "property changed",
+                "serialNumber": "ABCDEF1234567890",
+                "name": "currentMode",
+                "value": 63,
+            },
+        )
+    )
+    assert station.alarm_mode == 63
+    assert station.serial_number == "ABCDEF1234567890"
+
+
+def test_slots(station):
+    """Test that stations use slots but remain weak-referenceable."""
+    assert not hasattr(station, "__dict__")
+    assert weakref.ref(station)() is station
+
+
+def test_hash_and_eq(controller_state, station):
+    """Test that stations are compared by serial number."""
+    other = Station(Mock(), deepcopy(controller_state["stations"][0]))
+    assert station == other
+    assert hash(station) == hash(other)
+    assert {station: 1}[other] == 1
+
+
+def test_patched_handler(station):
+    """Test that patching a handler on the class intercepts dispatch."""
+    evt = Event(type="guard mode changed", data={"source": "station"})
+    with patch.object(Station, "handle_guard_mode_changed") as mock_handler:
+        station.receive_event(evt)
+    mock_handler.assert_called_once_with(evt)
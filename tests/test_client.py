@@ -1,13 +1,18 @@
 """Define tests for the client."""
 import asyncio
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from aiohttp.client_exceptions import ClientError, WSServerHandshakeError
 from aiohttp.client_reqrep import ClientResponse, RequestInfo
-from aiohttp.http_websocket import WSMsgType
+from aiohttp.http_websocket import WSMessage, WSMsgType
+import orjson
 import pytest
 
-from eufy_security_ws_python.client import WebsocketClient
+from eufy_security_ws_python.client import (
+    MESSAGES_PER_LOOP_YIELD,
+    SIZE_PARSE_JSON_EXECUTOR,
+    WebsocketClient,
+)
 from eufy_security_ws_python.const import MAX_SERVER_SCHEMA_VERSION
 from eufy_security_ws_python.errors import (
     CannotConnectError,
@@ -50,6 +55,16 @@ async def test_command_error_handling(client, mock_command):
     assert raised.value.error_code == "unknown_command"
 
 
+async def test_command_message_ids(client, mock_command):
+    """Test that each command gets its own message ID."""
+    ack_commands = mock_command({"command": "some_command"}, {})
+
+    await client.async_send_command({"command": "some_command"})
+    await client.async_send_command({"command": "some_command"})
+
+    assert [command["messageId"] for command in ack_commands] == ["0", "1"]
+
+
 async def test_connect_disconnect(client_session, url):
     """Test client connect and disconnect."""
     async with WebsocketClient(url, client_session) as client:
@@ -206,6 +221,42 @@ async def test_listen_unknown_result_type(
     ws_client.receive.assert_awaited()
 
 
+async def test_listen_yields_during_burst(
+    client_session, driver_ready, messages, url, ws_client
+):
+    """Test that a burst of buffered messages doesn't starve other tasks."""
+    client = WebsocketClient(url, client_session)
+    await client.async_connect()
+
+    async def receive():
+        """Return a buffered websocket message without suspending."""
+        message = messages.popleft()
+        if not messages:
+            ws_client.closed = True
+        return message
+
+    ws_client.receive.side_effect = receive
+    for _ in range(MESSAGES_PER_LOOP_YIELD * 2):
+        messages.append(
+            WSMessage(
+                WSMsgType.TEXT,
+                '{"type": "result", "messageId": "unknown", "success": true}',
+                None,
+            )
+        )
+
+    remaining_when_run = []
+
+    async def other_task():
+        """Record how many messages are left once this task gets to run."""
+        remaining_when_run.append(len(messages))
+
+    asyncio.create_task(other_task())
+    await client.async_listen(driver_ready)
+
+    assert remaining_when_run == [MESSAGES_PER_LOOP_YIELD]
+
+
 async def test_listen_without_connect(client_session, driver_ready, url):
     """Test listen without first being connected."""
     client = WebsocketClient(url, client_session)
@@ -237,6 +288,75 @@ async def test_min_schema_version(client_session, url, version_data):
     assert not client.connected
 
 
+@pytest.mark.parametrize(
+    "size, use_executor",
+    [(SIZE_PARSE_JSON_EXECUTOR, False), (SIZE_PARSE_JSON_EXECUTOR + 1, True)],
+)
+async def test_receive_json_executor_threshold(client, size, use_executor, ws_client):
+    """Test that only payloads over the threshold are parsed in the executor."""
+    prefix = '{"padding": "'
+    suffix = '"}'
+    ws_client.receive.side_effect = None
+    ws_client.receive.return_value = WSMessage(
+        WSMsgType.TEXT,
+        prefix + "x" * (size - len(prefix) - len(suffix)) + suffix,
+        None,
+    )
+
+    with patch.object(
+        client._loop,  # pylint: disable=protected-access
+        "run_in_executor",
+        wraps=client._loop.run_in_executor,  # pylint: disable=protected-access
+    ) as mock_run_in_executor:
+        await client._async_receive_json()  # pylint: disable=protected-access
+
+    assert mock_run_in_executor.called is use_executor
+
+
+@pytest.mark.parametrize(
+    "padding", [0, SIZE_PARSE_JSON_EXECUTOR], ids=["inline", "executor"]
+)
+async def test_receive_json(client, padding, ws_client):
+    """Test that received JSON is decoded with orjson."""
+    payload = {"type": "event", "padding": "x" * padding}
+    ws_client.receive.side_effect = None
+    ws_client.receive.return_value = WSMessage(
+        WSMsgType.TEXT, orjson.dumps(payload).decode(), None
+    )
+
+    with patch("orjson.loads", wraps=orjson.loads) as mock_loads:
+        data = await client._async_receive_json()  # pylint: disable=protected-access
+
+    assert data == payload
+    assert mock_loads.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "padding", [0, SIZE_PARSE_JSON_EXECUTOR], ids=["inline", "executor"]
+)
+async def test_receive_json_invalid(client, padding, ws_client):
+    """Test that malformed JSON raises InvalidMessage."""
+    ws_client.receive.side_effect = None
+    ws_client.receive.return_value = WSMessage(
+        WSMsgType.TEXT, '{"type": "event", "padding": "' + "x" * padding, None
+    )
+
+    with pytest.raises(InvalidMessage):
+        await client._async_receive_json()  # pylint: disable=protected-access
+
+
+async def test_send_json(client, mock_command, ws_client):
+    """Test that commands are encoded with orjson."""
+    mock_command({"command": "some_command"}, {})
+
+    await client.async_send_command({"command": "some_command", "value": [1, "a"]})
+
+    dumps = ws_client.send_json.call_args.kwargs["dumps"]
+    payload = ws_client.send_json.call_args.args[0]
+    assert dumps(payload) == orjson.dumps(payload).decode()
+    assert isinstance(dumps(payload), str)
+
+
 async def test_send_json_when_disconnected(client_session, url):
     """Test sending a JSON message when disconnected."""
     client = WebsocketClient(url, client_session)
@@ -10,3 +10,64 @@ def test_once():
     mock.emit("test-event", 1)
     mock.emit("test-event", 2)
     assert len(calls) == 1
+
+
+def test_handle_event_protocol():
+    """Test that events are routed to the matching handler."""
+    calls = []
+
+    class MockHandler(event.EventBase):
+        """Define a mock event handler."""
+
+        def handle_property_changed(self, evt):
+            """Handle a "property changed" event."""
+            calls.append(evt)
+
+        def handle_rtsp_url_changed(self, evt):
+            """Handle a "rtsp_url changed" event."""
+            calls.append(evt)
+
+    mock = MockHandler()
+    property_changed = event.Event(type="property changed")
+    rtsp_url_changed = event.Event(type="rtsp_url changed")
+    for evt in (property_changed, event.Event(type="unknown"), rtsp_url_changed):
+        mock._handle_event_protocol(evt)  # pylint: disable=protected-access
+    mock._handle_event_protocol(property_changed)  # pylint: disable=protected-access
+    assert calls == [property_changed, rtsp_url_changed, property_changed]
+
+
+def test_unsubscribe():
+    """Test that unsubscribing stops a callback from being called."""
+    mock = event.EventBase()
+    first_calls = []
+    second_calls = []
+    unsub = mock.on("test-event", first_calls.append)
+    mock.on("test-event", second_calls.append)
+    mock.emit("test-event", 1)
+    unsub()
+    unsub()
+    mock.emit("test-event", 2)
+    assert first_calls == [1]
+    assert second_calls == [1, 2]
+
+
+def test_unsubscribe_duplicate_callback():
+    """Test that unsubscribing only removes its own registration."""
+    mock = event.EventBase()
+    calls = []
+    unsub = mock.on("test-event", calls.append)
+    mock.on("test-event", calls.append)
+    unsub()
+    unsub()
+    mock.emit("test-event", 1)
+    assert calls == [1]
+
+
+def test_unsubscribe_last_listener():
+    """Test that an event name is dropped once its last listener unsubscribes."""
+    mock = event.EventBase()
+    calls = []
+    unsub = mock.on("test-event", calls.append)
+    assert "test-event" in mock._listeners  # pylint: disable=protected-access
+    unsub()
+    assert "test-event" not in mock._listeners  # pylint: disable=protected-access
@@ -1,8 +1,12 @@
 """Test the server version helper."""
+import copy
+from dataclasses import FrozenInstanceError
+import pickle
 from unittest.mock import call
 
 import pytest
 
+from eufy_security_ws_python.model.version import VersionInfo
 from eufy_security_ws_python.version import async_get_server_version
 
 
@@ -34,3 +38,23 @@ async def test_missing_server_schema_version(
     assert version_info.min_schema_version == 0
     assert version_info.max_schema_version == 0
     assert ws_client.close.called
+
+
+def test_version_info_immutable(version_data):
+    """Test that version info is a frozen, slotted value object."""
+    version_info = VersionInfo.from_message(version_data)
+
+    assert not hasattr(version_info, "__dict__")
+    assert version_info == VersionInfo.from_message(version_data)
+    assert hash(version_info) == hash(VersionInfo.from_message(version_data))
+
+    with pytest.raises(FrozenInstanceError):
+        version_info.server_version = "9.9.9"
+
+    for duplicate in (
+        copy.copy(version_info),
+        copy.deepcopy(version_info),
+        pickle.loads(pickle.dumps(version_info)),
+    ):
+        assert duplicate == version_info
+        assert duplicate is not version_info